@@ -2,7 +2,6 @@ import json
 import logging
 import time
 
-import jwt
 import requests
 
 from globus_sdk.response import GlobusHTTPResponse
@@ -10,12 +9,15 @@ from globus_sdk.response import GlobusHTTPResponse
 logger = logging.getLogger(__name__)
 
 
-def _convert_token_info_dict(source_dict):
+def _convert_token_info_dict(source_dict, now):
     """
     Extract a set of fields into a new dict for indexing by resource server.
     Allow for these fields to be `None` when absent:
         - "refresh_token"
         - "token_type"
+
+    ``now`` is the current time, taken once per response so that all tokens
+    received together get consistent expiration times.
     """
     expires_in = source_dict.get("expires_in", 0)
 
@@ -24,7 +26,7 @@ def _convert_token_info_dict(source_dict):
         "access_token": source_dict["access_token"],
         "refresh_token": source_dict.get("refresh_token"),
         "token_type": source_dict.get("token_type"),
-        "expires_at_seconds": int(time.time() + expires_in),
+        "expires_at_seconds": int(now + expires_in),
         "resource_server": source_dict["resource_server"],
     }
 
@@ -113,15 +115,16 @@ class OAuthTokenResponse(GlobusHTTPResponse):
         self._by_scopes = _ByScopesGetter(scope_map)
 
     def _init_rs_dict(self):
+        now = time.time()
         # call the helper at the top level
         self._by_resource_server = {
-            self["resource_server"]: _convert_token_info_dict(self)
+            self["resource_server"]: _convert_token_info_dict(self, now)
         }
         # call the helper on everything in 'other_tokens'
         self._by_resource_server.update(
             {
                 unprocessed_item["resource_server"]: _convert_token_info_dict(
-                    unprocessed_item
+                    unprocessed_item, now
                 )
                 for unprocessed_item in self["other_tokens"]
             }
@@ -166,6 +169,10 @@ class OAuthTokenResponse(GlobusHTTPResponse):
         """
         A parsed ID Token (OIDC) as a dict.
         """
+        # jwt pulls in cryptography, which is slow to import, so defer it until
+        # an ID token actually needs to be decoded
+        import jwt
+
         logger.info('Decoding ID Token "{}"'.format(self["id_token"]))
         auth_client = self._client
 
@@ -204,10 +211,11 @@ class OAuthDependentTokenResponse(OAuthTokenResponse):
     """
 
     def _init_rs_dict(self):
+        now = time.time()
         # call the helper on everything in the response array
         self._by_resource_server = {
             unprocessed_item["resource_server"]: _convert_token_info_dict(
-                unprocessed_item
+                unprocessed_item, now
             )
             for unprocessed_item in self.data
         }
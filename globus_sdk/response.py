@@ -97,9 +97,28 @@ class GlobusHTTPResponse(GlobusResponse):
         # worse).
         self.http_status = http_response.status_code
         self.content_type = http_response.headers.get("Content-Type")
+        # the body is decoded on first access to ``data`` and then reused, so
+        # that repeated item access does not reparse the JSON document
+        self._parsed_data = None
+        self._data_is_parsed = False
 
     @property
     def data(self):
+        """
+        The parsed JSON body of the response, or ``None`` if the body is not
+        valid JSON.
+
+        The body is parsed on first access and the result is cached, so every
+        access returns the same object. Modifying it (for example,
+        ``r.data["key"] = ...`` or ``r["DATA"].append(...)``) changes what all
+        later accesses to ``data`` and item lookups on the response see.
+        """
+        if not self._data_is_parsed:
+            self._parsed_data = self._parse_data()
+            self._data_is_parsed = True
+        return self._parsed_data
+
+    def _parse_data(self):
         try:
             return self._data.json()
         # JSON decoding may raise a ValueError due to an invalid JSON
@@ -1,5 +1,10 @@
+from unittest import mock
+
 import pytest
 
+import globus_sdk
+from tests.common import make_response
+
 
 def test_by_resource_server_lookups(oauth_token_response):
     by_rs = oauth_token_response.by_resource_server
@@ -20,6 +25,46 @@ def test_by_resource_server_lookups(oauth_token_response):
     assert by_rs["resource_server_3"]["scope"] == "scope3:0 scope3:1"
 
 
+def test_by_resource_server_reads_clock_once(make_oauth_token_response):
+    # if the clock were read per-token, each token would see a different time
+    with mock.patch(
+        "globus_sdk.auth.token_response.time.time",
+        side_effect=[1000.0, 2000.0, 3000.0],
+    ) as mock_time:
+        by_rs = make_oauth_token_response().by_resource_server
+    mock_time.assert_called_once_with()
+
+    assert len(by_rs) == 3
+    for tok in by_rs.values():
+        assert tok["expires_at_seconds"] == 1000 + 3600
+
+
+def test_dependent_tokens_by_resource_server_reads_clock_once():
+    with mock.patch(
+        "globus_sdk.auth.token_response.time.time",
+        side_effect=[1000.0, 2000.0, 3000.0],
+    ) as mock_time:
+        response = make_response(
+            response_class=globus_sdk.auth.token_response.OAuthDependentTokenResponse,
+            json_body=[
+                {
+                    "access_token": f"access_token_{n}",
+                    "expires_in": 3600,
+                    "resource_server": f"resource_server_{n}",
+                    "scope": f"scope{n}",
+                    "token_type": "bearer",
+                }
+                for n in (1, 2, 3)
+            ],
+        )
+        by_rs = response.by_resource_server
+    mock_time.assert_called_once_with()
+
+    assert len(by_rs) == 3
+    for tok in by_rs.values():
+        assert tok["expires_at_seconds"] == 1000 + 3600
+
+
 @pytest.mark.parametrize(
     "scopestr, resource_server",
     [
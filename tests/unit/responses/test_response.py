@@ -1,5 +1,6 @@
 import json
 from collections import namedtuple
+from unittest import mock
 
 import pytest
 import requests
@@ -73,6 +74,31 @@ def test_data(
     assert text_http_response.r.data is None
 
 
+def test_http_response_json_parsed_once(json_http_response):
+    """
+    Confirms that the JSON body is decoded once and reused on later access
+    """
+    raw_response = json_http_response.r._data
+    with mock.patch.object(raw_response, "json", wraps=raw_response.json) as m:
+        assert json_http_response.r.data == json_http_response.data
+        assert json_http_response.r["label1"] == "value1"
+        assert "label2" in json_http_response.r
+    m.assert_called_once_with()
+
+
+def test_http_response_data_is_shared(json_http_response):
+    """
+    Confirms that the parsed body is cached and shared, so that modifications
+    to it are seen by later accesses
+    """
+    response = json_http_response.r
+    assert response.data is response.data
+
+    response.data["label1"] = "modified"
+    assert response["label1"] == "modified"
+    assert response.data == {"label1": "modified", "label2": "value2"}
+
+
 def test_str(dict_response, list_response):
     """
     Confirms that individual values are seen in stringified responses
@@ -1,6 +1,14 @@
+import concurrent.futures
 import io
+import logging
 import os
-from configparser import ConfigParser
+import time
+from configparser import (
+    ConfigParser,
+    NoOptionError,
+    NoSectionError,
+    ParsingError,
+)
 from contextlib import contextmanager
 from unittest import mock
 
@@ -26,15 +34,9 @@ def custom_config(configdata):
         configdata = io.StringIO(configdata)
 
     def loadconf(cfgparser):
-        # try to use the new version of this method, added in py3.2
-        try:
-            readfp_func = cfgparser._parser.read_file
-        # but failover to the pre-3.2 version
-        except AttributeError:
-            readfp_func = cfgparser._parser.readfp
-        # and fail-open if there's some other issue
-
-        readfp_func(configdata)
+        parser = globus_sdk.config._FastIni()
+        parser.read_file(configdata)
+        return parser
 
     with mock.patch("globus_sdk.config.GlobusConfigParser._load_config", loadconf):
         globus_sdk.config._get_parser()
@@ -53,7 +55,10 @@ def only_lib_config():
     globus_sdk.config._parser = None
 
     def loadconf(cfgparser):
-        cfgparser._parser.read([globus_sdk.config._get_lib_config_path()])
+        parser = globus_sdk.config._FastIni()
+        with open(globus_sdk.config._get_lib_config_path()) as f:
+            parser.read_file(f)
+        return parser
 
     with mock.patch("globus_sdk.config.GlobusConfigParser._load_config", loadconf):
         yield
@@ -87,6 +92,90 @@ def test_get_lib_config():
             assert opt
 
 
+def test_fast_ini_reads_lib_config_like_configparser():
+    stdlib_parser = ConfigParser()
+    stdlib_parser.read(globus_sdk.config._get_lib_config_path())
+    fast_parser = globus_sdk.config._FastIni()
+    with open(globus_sdk.config._get_lib_config_path()) as f:
+        fast_parser.read_file(f)
+
+    for section in stdlib_parser.sections():
+        assert fast_parser.items(section) == stdlib_parser.items(section)
+
+
+def test_fast_ini_parsing():
+    """
+    Confirms that the INI reader handles comments, blank lines, and trailing
+    text after section headers, and lowercases option names
+    """
+    parser = globus_sdk.config._FastIni()
+    parser.read_file(
+        io.StringIO(
+            """\
+# leading comment
+[general] ; note
+Option = value with spaces
+; another comment
+
+[environment foo]
+key1 = value1
+key2 =
+"""
+        )
+    )
+    assert parser.get("general", "option") == "value with spaces"
+    assert parser.get("general", "OPTION") == "value with spaces"
+    assert parser.get("environment foo", "key1") == "value1"
+    assert parser.get("environment foo", "key2") == ""
+    with pytest.raises(NoOptionError):
+        parser.get("environment foo", "key3")
+    with pytest.raises(NoSectionError):
+        parser.get("nonexistent", "key1")
+
+
+@pytest.mark.parametrize(
+    "configdata",
+    [
+        "key = value\n",
+        "[general]\nnot an option\n",
+        "[general]\nkey: value\n",
+        "[general]\nkey = line one\n  line two\n",
+    ],
+)
+def test_fast_ini_rejects_unsupported_syntax(configdata):
+    parser = globus_sdk.config._FastIni()
+    # MissingSectionHeaderError is a ParsingError too
+    with pytest.raises(ParsingError):
+        parser.read_file(io.StringIO(configdata))
+
+
+@pytest.mark.parametrize(
+    "configdata, option",
+    [
+        ("[general] ; note\nhttp_timeout = 30\n", "http_timeout"),
+        ("[DEFAULT]\nhttp_timeout = 30\n", "http_timeout"),
+        ("[general]\nopt = line one\n  line two\n", "opt"),
+    ],
+)
+def test_user_config_read_like_configparser(tmp_path, configdata, option):
+    """
+    user config files are read with ConfigParser, so they may use any syntax it
+    supports, even where _FastIni does not
+    """
+    (tmp_path / ".globus.cfg").write_text(configdata)
+    stdlib_parser = ConfigParser()
+    stdlib_parser.read([globus_sdk.config._get_lib_config_path()])
+    stdlib_parser.read_string(configdata)
+
+    with mock.patch.dict(os.environ, {"HOME": str(tmp_path)}):
+        conf = globus_sdk.config.GlobusConfigParser()
+        assert isinstance(conf._parser, ConfigParser)
+    assert conf.get(option) == stdlib_parser.get("general", option)
+    assert conf.get(option, environment="default") == stdlib_parser.get(
+        "environment default", option, fallback=None
+    )
+
+
 def test_verify_ssl_true():
     with custom_config("[environment default]\nssl_verify = true\n"):
         assert globus_sdk.config.get_ssl_verify("default")
@@ -103,6 +192,15 @@ def test_verify_ssl_invalid():
             assert not globus_sdk.config.get_ssl_verify("default")
 
 
+def test_fast_ini_used_without_user_config(tmp_path):
+    with mock.patch.dict(os.environ, {"HOME": str(tmp_path)}):
+        conf = globus_sdk.config.GlobusConfigParser()
+        assert isinstance(conf._parser, globus_sdk.config._FastIni)
+    assert conf.get("auth_service", environment="default") == (
+        "https://auth.globus.org/"
+    )
+
+
 def test_init_loads():
     """
     ensure that initializing a config parser loads config
@@ -112,6 +210,45 @@ def test_init_loads():
         assert conf._parser.items("general") is not None
 
 
+def test_init_is_lazy():
+    """
+    ensure that config files are not read until a value is looked up
+    """
+    with mock.patch(
+        "globus_sdk.config.GlobusConfigParser._load_config"
+    ) as mock_load_config:
+        conf = globus_sdk.config.GlobusConfigParser()
+        mock_load_config.assert_not_called()
+
+        conf.get("option")
+        conf.get("option")
+        mock_load_config.assert_called_once_with()
+
+
+def test_concurrent_first_lookups_see_full_config():
+    """
+    ensure that a parser which is still loading is never visible to other
+    threads, by slowing down config loading so that lookups overlap it
+    """
+    real_read_file = globus_sdk.config._FastIni.read_file
+
+    def slow_read_file(self, *args, **kwargs):
+        time.sleep(0.05)
+        return real_read_file(self, *args, **kwargs)
+
+    conf = globus_sdk.config.GlobusConfigParser()
+    with mock.patch.object(globus_sdk.config._FastIni, "read_file", slow_read_file):
+        with mock.patch.dict(os.environ, {"HOME": "/nonexistent"}):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(conf.get, "transfer_service", environment="default")
+                    for _ in range(4)
+                ]
+                results = [f.result() for f in futures]
+
+    assert results == ["https://transfer.api.globus.org/"] * 4
+
+
 def test_conf_get():
     """
     Confirms that get reads expected results
@@ -156,6 +293,16 @@ option = environment_value
             )
 
 
+def test_conf_get_logs_env_value(caplog):
+    with custom_config("[general]\n"):
+        conf = globus_sdk.config._get_parser()
+        with mock.patch.dict(os.environ):
+            os.environ["GLOBUS_SDK_OPTION"] = "os_environ_value"
+            with caplog.at_level(logging.DEBUG, logger="globus_sdk.config"):
+                assert conf.get("option", check_env=True) == "os_environ_value"
+    assert "GLOBUS_SDK_OPTION=os_environ_value" in caplog.text
+
+
 def test_parser_is_singleton():
     # do two fetches, assert 'is'
     assert globus_sdk.config._get_parser() is globus_sdk.config._get_parser()